@@ -0,0 +1,252 @@
+"""
+armazenamento.py
+Armazena os resultados dos experimentos em um banco SQLite local
+As execuções são acumuladas (não sobrescritas) e as estatísticas
+são agregadas incrementalmente a cada nova execução
+"""
+
+import hashlib
+import math
+import os
+import sqlite3
+from datetime import datetime
+
+
+DB_PATH = os.path.join("resultados", "experimentos.db")
+
+# Métricas registradas em cada execução
+METRICS = ("lines", "time", "recursions")
+
+# Arquivos cujo conteúdo define a versão do código (inclui a medição de
+# linhas e tempo feita em experimento.py)
+SOURCE_FILES = ("nucleo.py", "sudoku.py", "recursividade.py", "experimento.py")
+
+
+def code_version(files=SOURCE_FILES):
+    """
+    Calcula a versão do código a partir do conteúdo dos arquivos fonte
+
+    Returns:
+        str: Hash curto (12 caracteres) dos arquivos
+    """
+    digest = hashlib.sha256()
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    for name in files:
+        with open(os.path.join(base_dir, name), "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:12]
+
+
+def puzzle_hash(board):
+    """
+    Calcula o hash de um tabuleiro
+
+    Args:
+        board: Tabuleiro 9x9
+
+    Returns:
+        str: Hash SHA-256 do tabuleiro
+    """
+    text = "".join(str(num) for row in board for num in row)
+    return hashlib.sha256(text.encode("ascii")).hexdigest()
+
+
+class ResultsStore:
+    """Banco SQLite com as execuções e os agregados por experimento"""
+
+    def __init__(self, path=DB_PATH):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.create_tables()
+
+    def create_tables(self):
+        """Cria as tabelas se ainda não existirem"""
+        with self.conn:
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS runs (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    engine TEXT NOT NULL,
+                    difficulty TEXT NOT NULL,
+                    code_version TEXT NOT NULL,
+                    execucao INTEGER NOT NULL,
+                    seed INTEGER NOT NULL,
+                    puzzle_hash TEXT NOT NULL,
+                    lines INTEGER NOT NULL,
+                    time REAL NOT NULL,
+                    recursions INTEGER NOT NULL,
+                    created_at TEXT NOT NULL,
+                    UNIQUE (engine, difficulty, code_version, execucao)
+                )
+            """)
+            self.conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_runs_puzzle
+                ON runs (engine, difficulty, puzzle_hash, code_version)
+            """)
+            # Agregados de Welford: count, mean e m2 (soma dos quadrados das diferenças)
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS aggregates (
+                    engine TEXT NOT NULL,
+                    difficulty TEXT NOT NULL,
+                    code_version TEXT NOT NULL,
+                    metric TEXT NOT NULL,
+                    count INTEGER NOT NULL,
+                    mean REAL NOT NULL,
+                    m2 REAL NOT NULL,
+                    PRIMARY KEY (engine, difficulty, code_version, metric)
+                )
+            """)
+
+    def close(self):
+        self.conn.close()
+
+    def completed_runs(self, engine, difficulty, version):
+        """
+        Conta quantas execuções já foram salvas (permite retomar o experimento)
+
+        Returns:
+            int: Número de execuções registradas
+        """
+        row = self.conn.execute(
+            "SELECT COUNT(*) FROM runs WHERE engine = ? AND difficulty = ? AND code_version = ?",
+            (engine, difficulty, version),
+        ).fetchone()
+        return row[0]
+
+    def add_run(self, engine, difficulty, version, execucao, seed, board, result):
+        """
+        Salva uma execução e atualiza os agregados na mesma transação
+
+        Args:
+            engine: Nome do resolvedor
+            difficulty: Dificuldade do puzzle
+            version: Versão do código
+            execucao: Número da execução (1, 2, ...)
+            seed: Semente que gerou o puzzle
+            board: Tabuleiro inicial do puzzle
+            result: dict com "lines", "time" e "recursions"
+        """
+        with self.conn:
+            self.conn.execute(
+                """
+                INSERT INTO runs (engine, difficulty, code_version, execucao, seed, puzzle_hash,
+                                  lines, time, recursions, created_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (engine, difficulty, version, execucao, seed, puzzle_hash(board),
+                 result["lines"], result["time"], result["recursions"],
+                 datetime.now().isoformat()),
+            )
+
+            for metric in METRICS:
+                self._update_aggregate(engine, difficulty, version, metric, result[metric])
+
+    def _update_aggregate(self, engine, difficulty, version, metric, value):
+        row = self.conn.execute(
+            """
+            SELECT count, mean, m2 FROM aggregates
+            WHERE engine = ? AND difficulty = ? AND code_version = ? AND metric = ?
+            """,
+            (engine, difficulty, version, metric),
+        ).fetchone()
+        count, mean, m2 = row if row else (0, 0.0, 0.0)
+
+        # Atualização incremental de Welford
+        count += 1
+        delta = value - mean
+        mean += delta / count
+        m2 += delta * (value - mean)
+
+        self.conn.execute(
+            """
+            INSERT OR REPLACE INTO aggregates (engine, difficulty, code_version, metric, count, mean, m2)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            (engine, difficulty, version, metric, count, mean, m2),
+        )
+
+    def runs(self, engine, difficulty, version):
+        """
+        Lista as execuções salvas em ordem
+
+        Returns:
+            list: dicts com "execucao", "seed", "puzzle_hash", "lines", "time" e "recursions"
+        """
+        cursor = self.conn.execute(
+            """
+            SELECT execucao, seed, puzzle_hash, lines, time, recursions FROM runs
+            WHERE engine = ? AND difficulty = ? AND code_version = ?
+            ORDER BY execucao
+            """,
+            (engine, difficulty, version),
+        )
+        return [
+            {"execucao": e, "seed": sd, "puzzle_hash": h, "lines": l, "time": t, "recursions": r}
+            for e, sd, h, l, t, r in cursor
+        ]
+
+    def difficulties(self, engine, version):
+        """Lista as dificuldades que possuem execuções salvas"""
+        cursor = self.conn.execute(
+            "SELECT DISTINCT difficulty FROM runs WHERE engine = ? AND code_version = ?",
+            (engine, version),
+        )
+        return [row[0] for row in cursor]
+
+    def percentile(self, engine, difficulty, version, metric, p):
+        """
+        Calcula o percentil p (0-100) de uma métrica pelo método nearest-rank
+
+        Returns:
+            float: Valor do percentil ou None se não houver execuções
+        """
+        if metric not in METRICS:
+            raise ValueError(f"Métrica inválida: {metric}")
+        if not 0 <= p <= 100:
+            raise ValueError(f"Percentil inválido: {p}")
+
+        count = self.completed_runs(engine, difficulty, version)
+        if count == 0:
+            return None
+
+        rank = max(1, math.ceil(p / 100 * count))
+        row = self.conn.execute(
+            f"""
+            SELECT {metric} FROM runs
+            WHERE engine = ? AND difficulty = ? AND code_version = ?
+            ORDER BY {metric} LIMIT 1 OFFSET ?
+            """,
+            (engine, difficulty, version, rank - 1),
+        ).fetchone()
+        return row[0]
+
+    def summary(self, engine, difficulty, version, percentiles=(50, 90, 99)):
+        """
+        Retorna as estatísticas agregadas de cada métrica
+
+        Returns:
+            dict: metric -> {"count", "mean", "stdev", "p50", ...}
+        """
+        cursor = self.conn.execute(
+            """
+            SELECT metric, count, mean, m2 FROM aggregates
+            WHERE engine = ? AND difficulty = ? AND code_version = ?
+            """,
+            (engine, difficulty, version),
+        )
+
+        stats = {}
+        for metric, count, mean, m2 in cursor.fetchall():
+            entry = {
+                "count": count,
+                "mean": mean,
+                # Desvio padrão amostral, como statistics.stdev
+                "stdev": math.sqrt(m2 / (count - 1)) if count > 1 else 0.0,
+            }
+            for p in percentiles:
+                entry[f"p{p}"] = self.percentile(engine, difficulty, version, metric, p)
+            stats[metric] = entry
+        return stats
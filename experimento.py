@@ -2,10 +2,16 @@ import sys
 import time
 import os
 import csv
+import argparse
+import random
 import matplotlib.pyplot as plt
 from sudoku import Sudoku
 from recursividade import RecursiveSudokuSolver
-import statistics
+from armazenamento import ResultsStore, code_version
+
+
+ENGINE = "recursivo"
+DIFFICULTIES = ["easy", "medium", "hard"]
 
 
 # =============================
@@ -22,15 +28,48 @@ class LineCounter:
 
 
 # =============================
-# EXECUTA TESTES
+# DIFICULDADES SALVAS (EM ORDEM)
+# =============================
+def stored_difficulties(store, version):
+    stored = store.difficulties(ENGINE, version)
+    return [d for d in DIFFICULTIES if d in stored]
+
+
+# =============================
+# SEMENTE DE CADA EXECUÇÃO
 # =============================
-def run_experiment(difficulty, runs=5):
-    results = []
+def run_seed(difficulty, execucao):
+    """
+    Deriva a semente do puzzle de uma execução
 
-    for i in range(runs):
-        print(f"Executando {difficulty} - Teste {i+1}")
+    A mesma (dificuldade, execução) sempre gera o mesmo puzzle, então uma
+    execução retomada ou repetida em outra versão do código é reprodutível.
+    Usa 63 bits para caber em um INTEGER do SQLite.
+    """
+    return random.Random(f"{difficulty}:{execucao}").getrandbits(63)
 
-        game = Sudoku(difficulty)
+
+# =============================
+# EXECUTA TESTES
+# =============================
+def run_experiment(store, version, difficulty, runs=5, target=None):
+    """
+    Executa e salva novas execuções para uma dificuldade
+
+    Args:
+        runs: Quantidade de execuções a acrescentar às já salvas
+        target: Se definido, só completa as execuções que faltam até esse total
+                (retoma um experimento interrompido); ignora runs
+    """
+    done = store.completed_runs(ENGINE, difficulty, version)
+    last = target if target is not None else done + runs
+
+    for execucao in range(done + 1, last + 1):
+        print(f"Executando {difficulty} - Teste {execucao}")
+
+        seed = run_seed(difficulty, execucao)
+        game = Sudoku(difficulty, seed=seed)
+        board = [row[:] for row in game.board]
         solver = RecursiveSudokuSolver(game)
 
         counter = LineCounter()
@@ -43,29 +82,29 @@ def run_experiment(difficulty, runs=5):
         end_time = time.time()
         sys.settrace(None)
 
-        results.append({
+        store.add_run(ENGINE, difficulty, version, execucao, seed, board, {
             "lines": counter.lines,
             "time": end_time - start_time,
             "recursions": solver.recursion_calls
         })
 
-    return results
+    return store.runs(ENGINE, difficulty, version)
 
 
 # =============================
-# SALVAR RESULTADOS EM CSV
+# EXPORTAR RESULTADOS EM CSV
 # =============================
-def save_csv(all_results):
+def save_csv(store, version):
     os.makedirs("resultados", exist_ok=True)
     path = os.path.join("resultados", "dados_experimento.csv")
 
     with open(path, mode="w", newline="") as file:
         writer = csv.writer(file)
-        writer.writerow(["Dificuldade", "Execucao", "Linhas", "Tempo", "Chamadas_Recursivas"])
+        writer.writerow(["Dificuldade", "Execucao", "Semente", "Hash_Puzzle", "Linhas", "Tempo", "Chamadas_Recursivas"])
 
-        for diff, results in all_results.items():
-            for i, r in enumerate(results):
-                writer.writerow([diff, i+1, r["lines"], r["time"], r["recursions"]])
+        for diff in stored_difficulties(store, version):
+            for r in store.runs(ENGINE, diff, version):
+                writer.writerow([diff, r["execucao"], r["seed"], r["puzzle_hash"], r["lines"], r["time"], r["recursions"]])
 
     print(f"CSV salvo em {path}")
 
@@ -73,11 +112,11 @@ def save_csv(all_results):
 # =============================
 # GRÁFICOS INDIVIDUAIS
 # =============================
-def plot_individual(all_results):
+def plot_individual(store, version):
     os.makedirs("images", exist_ok=True)
 
-    for diff, results in all_results.items():
-        lines = [r["lines"] for r in results]
+    for diff in stored_difficulties(store, version):
+        lines = [r["lines"] for r in store.runs(ENGINE, diff, version)]
 
         plt.figure()
         plt.plot(range(1, len(lines)+1), lines)
@@ -95,15 +134,15 @@ def plot_individual(all_results):
 # =============================
 # GRÁFICO COMPARATIVO
 # =============================
-def plot_comparison(all_results):
+def plot_comparison(store, version):
     os.makedirs("images", exist_ok=True)
 
-    difficulties = ["easy", "medium", "hard"]
+    difficulties = stored_difficulties(store, version)
     avg_lines = []
 
     for diff in difficulties:
-        values = [r["lines"] for r in all_results[diff]]
-        avg_lines.append(sum(values) / len(values))
+        stats = store.summary(ENGINE, diff, version)
+        avg_lines.append(stats["lines"]["mean"])
 
     plt.figure()
     plt.plot(difficulties, avg_lines)
@@ -117,7 +156,7 @@ def plot_comparison(all_results):
 
     print(f"Gráfico comparativo salvo em {path}")
 
-def save_averages(all_results):
+def save_averages(store, version):
     os.makedirs("resultados", exist_ok=True)
     path = os.path.join("resultados", "estatisticas_medias.csv")
 
@@ -125,23 +164,29 @@ def save_averages(all_results):
         writer = csv.writer(file)
         writer.writerow([
             "Dificuldade",
+            "Execucoes",
             "Media_Linhas",
             "Desvio_Padrao_Linhas",
+            "P50_Linhas",
+            "P90_Linhas",
             "Media_Tempo",
+            "P90_Tempo",
             "Media_Chamadas"
         ])
 
-        for diff, results in all_results.items():
-            lines = [r["lines"] for r in results]
-            times = [r["time"] for r in results]
-            recs = [r["recursions"] for r in results]
+        for diff in stored_difficulties(store, version):
+            stats = store.summary(ENGINE, diff, version)
 
             writer.writerow([
                 diff,
-                statistics.mean(lines),
-                statistics.stdev(lines),
-                statistics.mean(times),
-                statistics.mean(recs)
+                stats["lines"]["count"],
+                stats["lines"]["mean"],
+                stats["lines"]["stdev"],
+                stats["lines"]["p50"],
+                stats["lines"]["p90"],
+                stats["time"]["mean"],
+                stats["time"]["p90"],
+                stats["recursions"]["mean"]
             ])
 
     print(f"Estatísticas salvas em {path}")
@@ -150,16 +195,33 @@ def save_averages(all_results):
 # =============================
 # MAIN
 # =============================
+def parse_args():
+    parser = argparse.ArgumentParser(description="Experimento de desempenho do resolvedor recursivo")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--runs", type=int, default=5,
+                      help="execuções a acrescentar por dificuldade (padrão: 5)")
+    mode.add_argument("--target", type=int,
+                      help="completa as execuções que faltam até este total (retomar)")
+    mode.add_argument("--plot", action="store_true",
+                      help="apenas gera CSVs e gráficos com os dados já salvos")
+    return parser.parse_args()
+
+
 def main():
-    all_results = {}
+    args = parse_args()
+    store = ResultsStore()
+    version = code_version()
+
+    if not args.plot:
+        for difficulty in DIFFICULTIES:
+            run_experiment(store, version, difficulty, runs=args.runs, target=args.target)
 
-    for difficulty in ["easy", "medium", "hard"]:
-        all_results[difficulty] = run_experiment(difficulty, runs=5)
+    save_csv(store, version)
+    plot_individual(store, version)
+    plot_comparison(store, version)
+    save_averages(store, version)
 
-    save_csv(all_results)
-    plot_individual(all_results)
-    plot_comparison(all_results)
-    save_averages(all_results)
+    store.close()
 
     print("\nExperimento finalizado!")
 
@@ -0,0 +1,147 @@
+"""
+lote.py
+Gera e resolve lotes de Sudoku em paralelo usando o núcleo reentrante
+Compara a execução em pool de threads com a execução em pool de processos
+(o ganho das threads depende de um build free-threaded do CPython)
+"""
+
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import nucleo
+
+
+EXECUTORS = {
+    "thread": ThreadPoolExecutor,
+    "process": ProcessPoolExecutor
+}
+
+
+def make_seeds(count, seed=None):
+    """
+    Deriva uma semente por puzzle a partir de uma semente principal
+
+    Returns:
+        list: Sementes inteiras, uma por puzzle
+    """
+    rng = random.Random(seed)
+    return [rng.getrandbits(64) for _ in range(count)]
+
+
+def solve_task(difficulty, seed):
+    """
+    Gera e resolve um puzzle; todo o estado é local à chamada
+
+    Returns:
+        dict: Puzzle, solução encontrada e estatísticas da busca
+    """
+    board, solution = nucleo.generate(difficulty, random.Random(seed))
+
+    result = nucleo.copy_board(board)
+    stats = {}
+    start_time = time.perf_counter()
+    solved = nucleo.solve(result, stats)
+    end_time = time.perf_counter()
+
+    return {
+        "seed": seed,
+        "board": board,
+        "solution": result,
+        "solved": solved,
+        "time": end_time - start_time,
+        **stats
+    }
+
+
+def run_batch(difficulty, seeds, executor="thread", workers=None):
+    """
+    Executa um lote de puzzles em um pool
+
+    Args:
+        difficulty (str): 'easy', 'medium' ou 'hard'
+        seeds: Sementes dos puzzles
+        executor (str): 'thread' ou 'process'
+        workers: Número de workers (padrão do pool se None)
+
+    Returns:
+        list: Resultados na mesma ordem das sementes
+    """
+    if executor not in EXECUTORS:
+        raise ValueError(f"Executor inválido: {executor}")
+
+    with EXECUTORS[executor](max_workers=workers) as pool:
+        return run_on_pool(pool, difficulty, seeds)
+
+
+def run_on_pool(pool, difficulty, seeds):
+    """Executa um lote em um pool já criado, na ordem das sementes"""
+    return list(pool.map(solve_task, [difficulty] * len(seeds), seeds))
+
+
+def _warm_up(_):
+    # Mantém cada worker ocupado por um instante para que o pool crie todos
+    time.sleep(0.05)
+
+
+def warm_up(pool, workers):
+    """Força a criação dos workers antes da medição"""
+    list(pool.map(_warm_up, range(workers)))
+
+
+def gil_enabled():
+    """Retorna False apenas em builds free-threaded com o GIL desativado"""
+    check = getattr(sys, "_is_gil_enabled", None)
+    return True if check is None else check()
+
+
+def benchmark(difficulty="medium", count=32, seed=0, workers=None):
+    """
+    Mede o tempo do mesmo lote em série, em threads e em processos
+    A criação e o encerramento dos pools ficam fora da medição
+
+    Returns:
+        dict: modo -> tempo total em segundos
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    seeds = make_seeds(count, seed)
+    timings = {}
+
+    start_time = time.perf_counter()
+    expected = [solve_task(difficulty, s) for s in seeds]
+    timings["serial"] = time.perf_counter() - start_time
+
+    for executor, pool_class in EXECUTORS.items():
+        with pool_class(max_workers=workers) as pool:
+            warm_up(pool, workers)
+
+            start_time = time.perf_counter()
+            results = run_on_pool(pool, difficulty, seeds)
+            timings[executor] = time.perf_counter() - start_time
+
+        # Mesmas sementes devem produzir os mesmos puzzles e soluções
+        if [r["solution"] for r in results] != [r["solution"] for r in expected]:
+            raise RuntimeError(f"Resultados divergentes no modo {executor}")
+
+    return timings
+
+
+def main():
+    workers = os.cpu_count()
+    print(f"Python {sys.version.split()[0]} - GIL ativo: {gil_enabled()} - workers: {workers}")
+
+    for difficulty in ["easy", "medium", "hard"]:
+        timings = benchmark(difficulty, count=32, seed=0, workers=workers)
+        serial = timings["serial"]
+
+        print(f"\n{difficulty}:")
+        for mode, elapsed in timings.items():
+            print(f"  {mode:8s} {elapsed:.3f}s  (speedup {serial / elapsed:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
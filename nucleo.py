@@ -0,0 +1,195 @@
+"""
+nucleo.py
+Núcleo reentrante do Sudoku: validação, resolução e geração
+Não há estado global mutável: as tabelas de vizinhos são imutáveis e
+compartilhadas, o estado de cada busca é local à chamada e a aleatoriedade
+vem de um random.Random passado explicitamente. Pode ser usado por várias
+threads ao mesmo tempo.
+"""
+
+import random
+
+
+SIZE = 9
+
+# Quantidade de células a tentar remover por dificuldade
+DIFFICULTY_MAP = {
+    'easy': 35,
+    'medium': 45,
+    'hard': 55
+}
+
+
+def _build_peers():
+    """Calcula, para cada célula, as células da mesma linha, coluna e quadrante"""
+    peers = []
+    for row in range(SIZE):
+        row_peers = []
+        for col in range(SIZE):
+            box_row, box_col = 3 * (row // 3), 3 * (col // 3)
+            cells = {(row, j) for j in range(SIZE)}
+            cells |= {(i, col) for i in range(SIZE)}
+            cells |= {(i, j)
+                      for i in range(box_row, box_row + 3)
+                      for j in range(box_col, box_col + 3)}
+            cells.discard((row, col))
+            row_peers.append(tuple(sorted(cells)))
+        peers.append(tuple(row_peers))
+    return tuple(peers)
+
+
+# PEERS[row][col] -> tupla com as 20 células vizinhas de (row, col)
+PEERS = _build_peers()
+
+
+def is_valid(board, row, col, num):
+    """
+    Verifica se um número pode ser colocado em uma posição
+
+    Args:
+        board: Tabuleiro atual
+        row: Linha
+        col: Coluna
+        num: Número a verificar
+
+    Returns:
+        bool: True se o número é válido na posição
+    """
+    for i, j in PEERS[row][col]:
+        if board[i][j] == num:
+            return False
+    return True
+
+
+def find_empty(board):
+    """
+    Encontra a primeira célula vazia
+
+    Returns:
+        tuple: (row, col) ou None se o tabuleiro está cheio
+    """
+    for i in range(SIZE):
+        for j in range(SIZE):
+            if board[i][j] == 0:
+                return i, j
+    return None
+
+
+def solve(board, stats=None):
+    """
+    Resolve o tabuleiro no próprio lugar usando backtracking
+
+    Args:
+        board: Tabuleiro a resolver (modificado)
+        stats: dict opcional preenchido com "recursions", "steps" e "max_depth"
+
+    Returns:
+        bool: True se conseguiu resolver
+    """
+    if stats is None:
+        stats = {}
+    stats.update(recursions=0, steps=0, max_depth=0)
+
+    def backtrack(depth):
+        stats["recursions"] += 1
+        if depth > stats["max_depth"]:
+            stats["max_depth"] = depth
+
+        empty = find_empty(board)
+        if not empty:
+            return True
+
+        row, col = empty
+        for num in range(1, 10):
+            if is_valid(board, row, col, num):
+                board[row][col] = num
+                stats["steps"] += 1
+
+                if backtrack(depth + 1):
+                    return True
+
+                board[row][col] = 0
+        return False
+
+    return backtrack(0)
+
+
+def fill_board(board, rng):
+    """
+    Preenche o tabuleiro completamente de forma aleatória
+
+    Args:
+        board: Tabuleiro a preencher (modificado)
+        rng: Instância de random.Random
+
+    Returns:
+        bool: True se conseguiu preencher
+    """
+    empty = find_empty(board)
+    if not empty:
+        return True
+
+    row, col = empty
+    numbers = list(range(1, 10))
+    rng.shuffle(numbers)
+
+    for num in numbers:
+        if is_valid(board, row, col, num):
+            board[row][col] = num
+
+            if fill_board(board, rng):
+                return True
+
+            board[row][col] = 0
+    return False
+
+
+def remove_numbers(board, attempts, rng):
+    """
+    Remove números do tabuleiro completo para criar o puzzle
+
+    Args:
+        board: Tabuleiro completo (modificado)
+        attempts: Número de células a tentar remover
+        rng: Instância de random.Random
+    """
+    while attempts > 0:
+        row = rng.randint(0, 8)
+        col = rng.randint(0, 8)
+
+        if board[row][col] != 0:
+            backup = board[row][col]
+            board[row][col] = 0
+
+            # Verifica se o puzzle ainda tem solução (versão simplificada)
+            if not solve(copy_board(board)):
+                board[row][col] = backup
+
+            attempts -= 1
+
+
+def generate(difficulty='medium', rng=None):
+    """
+    Gera um novo puzzle
+
+    Args:
+        difficulty (str): 'easy', 'medium' ou 'hard'
+        rng: Instância de random.Random (uma nova é criada se None)
+
+    Returns:
+        tuple: (board, solution)
+    """
+    if rng is None:
+        rng = random.Random()
+
+    solution = [[0] * SIZE for _ in range(SIZE)]
+    fill_board(solution, rng)
+
+    board = copy_board(solution)
+    remove_numbers(board, DIFFICULTY_MAP.get(difficulty, 45), rng)
+    return board, solution
+
+
+def copy_board(board):
+    """Copia um tabuleiro 9x9"""
+    return [row[:] for row in board]
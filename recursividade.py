@@ -5,80 +5,95 @@ Salva logs e estatísticas na pasta /resultados
 """
 
 import time
-import copy
 import os
 from datetime import datetime
 from sudoku import Sudoku
+import nucleo
+
+
+RESULTS_DIR = "resultados"
+LOG_PATH = os.path.join(RESULTS_DIR, "iteracoes_recursividade.txt")
+STATS_PATH = os.path.join(RESULTS_DIR, "estatisticas.txt")
 
 
 class RecursiveSudokuSolver:
-    def __init__(self, sudoku_game):
-        self.game = sudoku_game
-        self.board = copy.deepcopy(sudoku_game.board)
+    def __init__(self, sudoku_game, log=None):
+        """
+        Args:
+            sudoku_game: Jogo cujo tabuleiro será copiado e resolvido
+            log: Função opcional que recebe cada mensagem da busca
+                 (padrão: nenhuma saída)
+        """
+        self.difficulty = sudoku_game.difficulty
+        self.board = nucleo.copy_board(sudoku_game.board)
         self.size = 9
+        self.log_sink = log
         self.steps = 0
         self.recursion_calls = 0
         self.max_depth = 0
 
-        # Criar pasta resultados se não existir
-        self.results_dir = "resultados"
-        os.makedirs(self.results_dir, exist_ok=True)
-
-        self.log_path = os.path.join(self.results_dir, "iteracoes_recursividade.txt")
-        self.stats_path = os.path.join(self.results_dir, "estatisticas.txt")
-
-        # Limpa arquivo de log ao iniciar
-        with open(self.log_path, "w", encoding="utf-8") as f:
-            f.write("=== LOG DE RECURSIVIDADE - SUDOKU ===\n\n")
-
     def log(self, message):
-        with open(self.log_path, "a", encoding="utf-8") as f:
-            f.write(message + "\n")
+        if self.log_sink is not None:
+            self.log_sink(message)
 
     def is_valid(self, row, col, num):
-        return self.game.is_valid(self.board, row, col, num)
+        # Lê apenas o tabuleiro próprio, sem passar pela instância de Sudoku
+        return nucleo.is_valid(self.board, row, col, num)
 
     def find_empty(self):
-        for i in range(self.size):
-            for j in range(self.size):
-                if self.board[i][j] == 0:
-                    return i, j
-        return None
+        return nucleo.find_empty(self.board)
+
+    def solve(self):
+        """Resolve o tabuleiro; os contadores são reiniciados a cada chamada"""
+        self.steps = 0
+        self.recursion_calls = 0
+        self.max_depth = 0
+        return self._solve(0)
 
-    def solve(self, depth=0):
+    def _solve(self, depth):
+        # Sem log_sink nenhuma mensagem é montada: a busca medida em
+        # experimento.py não paga pela formatação
         self.recursion_calls += 1
         self.max_depth = max(self.max_depth, depth)
 
+        # Recuo do log: 2 espaços por nível (não afeta max_depth)
+        indent = " " * (2 * depth) if self.log_sink is not None else ""
+
         empty = self.find_empty()
 
         if not empty:
-            self.log(" " * depth + "✔ Sudoku resolvido!")
+            if self.log_sink is not None:
+                self.log_sink(indent + "✔ Sudoku resolvido!")
             return True
 
         row, col = empty
 
         for num in range(1, 10):
-            self.log(" " * depth + f"Testando {num} em ({row},{col})")
+            if self.log_sink is not None:
+                self.log_sink(indent + f"Testando {num} em ({row},{col})")
 
             if self.is_valid(row, col, num):
-                self.log(" " * depth + f"✔ {num} válido -> descendo recursão")
+                if self.log_sink is not None:
+                    self.log_sink(indent + f"✔ {num} válido -> descendo recursão")
                 self.board[row][col] = num
                 self.steps += 1
 
-                if self.solve(depth + 2):
+                if self._solve(depth + 1):
                     return True
 
-                self.log(" " * depth + f"↩ Backtracking removendo {num} de ({row},{col})")
+                if self.log_sink is not None:
+                    self.log_sink(indent + f"↩ Backtracking removendo {num} de ({row},{col})")
                 self.board[row][col] = 0
 
-        self.log(" " * depth + f"✖ Nenhum número válido em ({row},{col})")
+        if self.log_sink is not None:
+            self.log_sink(indent + f"✖ Nenhum número válido em ({row},{col})")
         return False
 
-    def save_statistics(self, execution_time):
-        with open(self.stats_path, "w", encoding="utf-8") as f:
+    def save_statistics(self, execution_time, path=STATS_PATH):
+        with open(path, "w", encoding="utf-8") as f:
             f.write("=== ESTATÍSTICAS DA EXECUÇÃO ===\n\n")
             f.write(f"Data/Hora: {datetime.now()}\n")
-            f.write(f"Dificuldade: {self.game.difficulty}\n")
+            f.write(f"Dificuldade: {self.difficulty}\n")
             f.write(f"Chamadas recursivas: {self.recursion_calls}\n")
             f.write(f"Passos realizados: {self.steps}\n")
             f.write(f"Profundidade máxima atingida: {self.max_depth}\n")
@@ -89,15 +104,21 @@ def main():
     print("Gerando Sudoku...")
     game = Sudoku("hard")
 
-    solver = RecursiveSudokuSolver(game)
+    # Criar pasta resultados se não existir
+    os.makedirs(RESULTS_DIR, exist_ok=True)
 
     print("Resolvendo... (arquivos serão salvos na pasta /resultados)")
-    start_time = time.time()
+    with open(LOG_PATH, "w", encoding="utf-8") as log_file:
+        log_file.write("=== LOG DE RECURSIVIDADE - SUDOKU ===\n\n")
+
+        solver = RecursiveSudokuSolver(game, log=lambda message: log_file.write(message + "\n"))
+
+        start_time = time.time()
 
-    solved = solver.solve()
+        solved = solver.solve()
 
-    end_time = time.time()
-    execution_time = end_time - start_time
+        end_time = time.time()
+        execution_time = end_time - start_time
 
     solver.save_statistics(execution_time)
 
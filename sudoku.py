@@ -1,5 +1,5 @@
 import random
-import copy
+import nucleo
 
 
 class Sudoku:
@@ -10,18 +10,20 @@ class Sudoku:
     WHITE = '\033[97m'
     RESET = '\033[0m'
     
-    def __init__(self, difficulty='medium'):
+    def __init__(self, difficulty='medium', seed=None):
         """
         Inicializa um novo jogo de Sudoku
         
         Args:
             difficulty (str): Nível de dificuldade - 'easy', 'medium', 'hard'
+            seed: Semente do gerador aleatório da instância (None = aleatória)
         """
         self.size = 9
         self.board = [[0 for _ in range(self.size)] for _ in range(self.size)]
         self.solution = [[0 for _ in range(self.size)] for _ in range(self.size)]
         self.fixed = [[False for _ in range(self.size)] for _ in range(self.size)]  # Células fixas (originais)
         self.difficulty = difficulty
+        self.rng = random.Random(seed)  # Gerador próprio, não usa o random global
         self.generate_puzzle()
     
     def is_valid(self, board, row, col, num):
@@ -37,22 +39,11 @@ class Sudoku:
         Returns:
             bool: True se o número é válido na posição
         """
-        # Verifica linha
-        if num in board[row]:
+        # nucleo.is_valid ignora a própria célula; mantém o comportamento
+        # original de recusar o número que já ocupa a posição
+        if board[row][col] == num:
             return False
-        
-        # Verifica coluna
-        if num in [board[i][col] for i in range(self.size)]:
-            return False
-        
-        # Verifica quadrante 3x3
-        box_row, box_col = 3 * (row // 3), 3 * (col // 3)
-        for i in range(box_row, box_row + 3):
-            for j in range(box_col, box_col + 3):
-                if board[i][j] == num:
-                    return False
-        
-        return True
+        return nucleo.is_valid(board, row, col, num)
     
     def solve(self, board):
         """
@@ -64,20 +55,7 @@ class Sudoku:
         Returns:
             bool: True se conseguiu resolver
         """
-        for row in range(self.size):
-            for col in range(self.size):
-                if board[row][col] == 0:
-                    for num in range(1, 10):
-                        if self.is_valid(board, row, col, num):
-                            board[row][col] = num
-                            
-                            if self.solve(board):
-                                return True
-                            
-                            board[row][col] = 0
-                    
-                    return False
-        return True
+        return nucleo.solve(board)
     
     def fill_board(self, board):
         """
@@ -89,23 +67,7 @@ class Sudoku:
         Returns:
             bool: True se conseguiu preencher
         """
-        for row in range(self.size):
-            for col in range(self.size):
-                if board[row][col] == 0:
-                    numbers = list(range(1, 10))
-                    random.shuffle(numbers)
-                    
-                    for num in numbers:
-                        if self.is_valid(board, row, col, num):
-                            board[row][col] = num
-                            
-                            if self.fill_board(board):
-                                return True
-                            
-                            board[row][col] = 0
-                    
-                    return False
-        return True
+        return nucleo.fill_board(board, self.rng)
     
     def remove_numbers(self, board, attempts):
         """
@@ -115,20 +77,7 @@ class Sudoku:
             board: Tabuleiro completo
             attempts: Número de células a tentar remover
         """
-        while attempts > 0:
-            row = random.randint(0, 8)
-            col = random.randint(0, 8)
-            
-            if board[row][col] != 0:
-                backup = board[row][col]
-                board[row][col] = 0
-                
-                # Verifica se o puzzle ainda tem solução única
-                board_copy = copy.deepcopy(board)
-                if not self.has_unique_solution(board_copy):
-                    board[row][col] = backup
-                
-                attempts -= 1
+        nucleo.remove_numbers(board, attempts, self.rng)
     
     def has_unique_solution(self, board):
         """
@@ -141,27 +90,11 @@ class Sudoku:
             bool: True se tem solução
         """
         # Versão simplificada - apenas verifica se é possível resolver
-        return self.solve(copy.deepcopy(board))
+        return nucleo.solve(nucleo.copy_board(board))
     
     def generate_puzzle(self):
         """Gera um novo puzzle de Sudoku"""
-        # Cria um tabuleiro completo válido
-        self.solution = [[0 for _ in range(self.size)] for _ in range(self.size)]
-        self.fill_board(self.solution)
-        
-        # Copia a solução para o board
-        self.board = copy.deepcopy(self.solution)
-        
-        # Define quantos números remover baseado na dificuldade
-        difficulty_map = {
-            'easy': 35,
-            'medium': 45,
-            'hard': 55
-        }
-        attempts = difficulty_map.get(self.difficulty, 45)
-        
-        # Remove números para criar o puzzle
-        self.remove_numbers(self.board, attempts)
+        self.board, self.solution = nucleo.generate(self.difficulty, self.rng)
         
         # Marca as células que não foram removidas como fixas
         for i in range(self.size):
@@ -296,7 +229,7 @@ class Sudoku:
         if not empty_cells:
             return None
         
-        row, col = random.choice(empty_cells)
+        row, col = self.rng.choice(empty_cells)
         num = self.solution[row][col]
         return (row, col, num)
     